@@ -18,14 +18,21 @@
 
 import inspect
 import math
+import numbers
 
 import numpy
 
 from cicada.arithmetic import Field
-from cicada.communicator.interface import Communicator
+from cicada.communicator.interface import Communicator, Tag
 from cicada.encoding import FixedPoint, Identity, Boolean
 from cicada.przs import PRZSProtocol
 
+# Number of bit extraction rounds whose random masks bit_decompose generates
+# at once.  Larger batches need fewer random_bitwise_secret calls (and their
+# communication rounds), but hold field.bits shared bits per element for every
+# round in the batch.
+_BIT_DECOMPOSE_BATCH = 8
+
 
 class AdditiveArrayShare(object):
     """Stores the local share of a secret shared array for :class:`AdditiveProtocolSuite`.
@@ -42,7 +49,8 @@ class AdditiveArrayShare(object):
 
 
     def __getitem__(self, index):
-        return AdditiveArrayShare(numpy.array(self._storage[index], dtype=self._storage.dtype)) # pragma: no cover
+        # Slices are returned as views; scalars are wrapped in zero-dimensional arrays.
+        return AdditiveArrayShare(numpy.asarray(self._storage[index], dtype=self._storage.dtype)) # pragma: no cover
 
 
     @property
@@ -51,6 +59,11 @@ class AdditiveArrayShare(object):
         Access is provided only for serialization and communication -
         callers must use :class:`AdditiveProtocolSuite` to manipulate secret
         shares.
+
+        Storage is not copied on assignment, so it may be shared with other
+        secret shares, e.g. when a share is indexed or sliced.  Callers must
+        treat storage as read-only: modifying it in-place may silently
+        change other shares.
         """
         return self._storage
 
@@ -59,7 +72,12 @@ class AdditiveArrayShare(object):
     def storage(self, storage):
         if not isinstance(storage, numpy.ndarray):
             raise ValueError(f"Expected numpy.ndarray, got {type(storage)}.") # pragma: no cover
-        self._storage = numpy.array(storage, dtype=object)
+        # Storage isn't copied, so a share may alias another share's storage
+        # (e.g. the views returned by __getitem__, or the slices taken in
+        # divide, less, and _lsb).  This is safe because wrapped storage is
+        # never modified: protocol operations only update arrays in-place
+        # before wrapping them, and always return results in new arrays.
+        self._storage = numpy.asarray(storage, dtype=object)
 
 
 class AdditiveProtocolSuite(object):
@@ -126,6 +144,31 @@ class AdditiveProtocolSuite(object):
         self._encoding = encoding
         self._przs = PRZSProtocol(communicator=communicator, field=field, seed=seed)
 
+        # Identify which players will receive polynomial terms from each
+        # player during private-private multiplication.  This only depends on
+        # the communicator, so we compute it once up-front.
+        world_size = communicator.world_size
+        count = math.ceil((world_size - 1) / 2)
+        self._multiply_dst = []
+        for src in communicator.ranks:
+            if world_size % 2 == 0 and src >= count:
+                dst = [(src + 1 + i) % world_size for i in range(count - 1)]
+            else:
+                dst = [(src + 1 + i) % world_size for i in range(count)]
+            self._multiply_dst.append(dst)
+        self._multiply_src = [src for src, dst in zip(communicator.ranks, self._multiply_dst) if communicator.rank in dst]
+
+        # Powers of two used to compose bits, keyed by bit count.
+        self._bit_shifts = {}
+
+        # Public constants, which broadcast against arrays of any shape.
+        self._zero = numpy.array(0, dtype=field.dtype)
+        self._one = numpy.array(1, dtype=field.dtype)
+        self._two = numpy.array(2, dtype=field.dtype)
+        self._half = numpy.array(pow(2, field.order-2, field.order), dtype=field.dtype)
+        for constant in (self._zero, self._one, self._two, self._half):
+            constant.flags.writeable = False
+
 
     def _assert_binary_compatible(self, lhs, rhs, lhslabel, rhslabel):
         self._assert_unary_compatible(lhs, lhslabel)
@@ -165,11 +208,7 @@ class AdditiveProtocolSuite(object):
         """
         self._assert_unary_compatible(operand, "operand")
         ltz = self.less_zero(operand)
-        nltz = self.logical_not(ltz)
-        addinvop = self.negative(operand)
-        ltz_parts = self.field_multiply(ltz, addinvop)
-        nltz_parts = self.field_multiply(nltz, operand)
-        return self.field_add(ltz_parts, nltz_parts)
+        return self._select(ltz, self.negative(operand), operand)
 
 
     def add(self, lhs, rhs, *, encoding=None):
@@ -241,10 +280,9 @@ class AdditiveProtocolSuite(object):
         """
         self._assert_unary_compatible(operand, "operand")
 
-        result = numpy.empty(operand.storage.shape[:-1], dtype=object)
-        shift = numpy.power(2, numpy.arange(operand.storage.shape[-1], dtype=self.field.dtype)[::-1])
-        shifted = self.field.multiply(operand.storage, shift)
-        result = numpy.sum(shifted, axis=-1, out=result)
+        shift = self._powers_of_two(operand.storage.shape[-1])
+        result = numpy.empty(operand.storage.shape[:-1], dtype=self.field.dtype)
+        result = numpy.sum(operand.storage * shift, axis=-1, out=result)
         result %= self.field.order
         return AdditiveArrayShare(result)
 
@@ -279,17 +317,23 @@ class AdditiveProtocolSuite(object):
 
         if bits is None:
             bits = self.field.bits
-        list_o_bits = []
-        two_inv = numpy.array(pow(2, self.field.order-2, self.field.order), dtype=self.field.dtype)
-        for element in operand.storage.flat: # Iterates in "C" order.
-            loopop = AdditiveArrayShare(numpy.array(element, dtype=self.field.dtype))
-            elebits = []
-            for i in range(bits):
-                elebits.append(self._lsb(loopop))
-                loopop = self.field_subtract(loopop, elebits[-1])
-                loopop = AdditiveArrayShare(self.field.multiply(loopop.storage, two_inv))
-            list_o_bits.append(elebits[::-1])
-        return AdditiveArrayShare(numpy.array([x.storage for y in list_o_bits for x in y]).reshape(operand.storage.shape+(bits,)))
+
+        # Random masks are generated for a batch of rounds at a time, see
+        # _BIT_DECOMPOSE_BATCH.
+        batch = _BIT_DECOMPOSE_BATCH
+
+        # Extract bits from every element at once, starting with the least significant.
+        result = numpy.empty(operand.storage.shape + (bits,), dtype=self.field.dtype)
+        remaining = operand
+        for i in range(bits):
+            if i % batch == 0:
+                mask_bits, masks = self.random_bitwise_secret(bits=self.field.bits, shape=(min(batch, bits - i), operand.storage.size))
+            bit = self._lsb(remaining, mask_bits=AdditiveArrayShare(mask_bits.storage[i % batch]), mask=AdditiveArrayShare(masks.storage[i % batch]))
+            result[..., bits - 1 - i] = bit.storage
+            if i < bits - 1:
+                remaining = self.field_subtract(remaining, bit)
+                remaining = AdditiveArrayShare(self.field.multiply(remaining.storage, self._half))
+        return AdditiveArrayShare(result)
 
 
     @property
@@ -320,6 +364,20 @@ class AdditiveProtocolSuite(object):
             Encodes public operands and determines the number of bits to
             shift right from intermediate results.  The protocol's
             :attr:`encoding` is used by default if :any:`None`.
+        rmask: :class:`AdditiveArrayShare`, optional
+            Secret shared random mask with the same shape as `rhs`, used
+            for private-private division.  If :any:`None` (the default), or
+            if `rmask` contains any zeros, a new mask is generated with
+            :meth:`random_bitwise_secret`.
+        mask1, rem1: :class:`AdditiveArrayShare`, optional
+            Truncation and remainder masks passed to :meth:`right_shift` when
+            truncating the masked divisor.  Generated if either is :any:`None`.
+        mask2, rem2: :class:`AdditiveArrayShare`, optional
+            Truncation and remainder masks passed to :meth:`right_shift` when
+            truncating the masked dividend.  Generated if either is :any:`None`.
+        mask3, rem3: :class:`AdditiveArrayShare`, optional
+            Truncation and remainder masks passed to :meth:`right_shift` when
+            truncating the quotient.  Generated if either is :any:`None`.
 
         Returns
         -------
@@ -330,48 +388,56 @@ class AdditiveProtocolSuite(object):
 
         # Private-private division.
         if isinstance(lhs, AdditiveArrayShare) and isinstance(rhs, AdditiveArrayShare):
-            zshare = self.share(src=0, secret=numpy.zeros_like(rhs.storage), shape=rhs.storage.shape)
-            check = self.reveal(self.equal(rhs, zshare), encoding=Boolean())
-            if not len(check.shape):
-                if check:
-                    raise ZeroDivisionError()
-            else:
-                if check.any():   
+            # Check the divisor and the mask for zeros with a single reveal,
+            # regenerating the mask in the unlikely event that it contains one.
+            if rmask is None:
+                _, rmask = self.random_bitwise_secret(bits=encoding.precision, shape=rhs.storage.shape)
+            shape = (2,) + rhs.storage.shape
+            zshare = self.share(src=0, secret=numpy.zeros(shape), shape=shape)
+            while True:
+                check = self.reveal(self.equal(AdditiveArrayShare(numpy.stack((rhs.storage, rmask.storage))), zshare), encoding=Boolean())
+                if numpy.any(check[0]):
                     raise ZeroDivisionError()
-            oops = True
-            while oops:
-                if rmask is None:
-                    _, rmask = self.random_bitwise_secret(bits=encoding.precision, shape=rhs.storage.shape)
-                else:
-                    oops = False
-                if not len(rhs.storage.shape):
-                    if self.reveal(self.equal(rmask, zshare), encoding=Boolean()):
-                        rmask = None
-                else:
-                    if self.reveal(self.equal(rmask, zshare), encoding=Boolean()).any():
-                        rmask = None
-            rhsmasked = self.field_multiply(rmask, rhs)
-            if mask1 != None and rem1 != None:
-                rhsmasked = self.right_shift(rhsmasked, bits=encoding.precision, trunc_mask=mask1, rem_mask=rem1)
+                if not numpy.any(check[1]):
+                    break
+                _, rmask = self.random_bitwise_secret(bits=encoding.precision, shape=rhs.storage.shape)
+            # Masking the divisor and dividend are independent, so we
+            # multiply and truncate both of them at the same time.
+            operands = AdditiveArrayShare(numpy.stack((rhs.storage, lhs.storage)))
+            masks = AdditiveArrayShare(numpy.stack((rmask.storage, rmask.storage)))
+            products = self.field_multiply(masks, operands)
+            if (mask1 is not None and rem1 is not None) or (mask2 is not None and rem2 is not None):
+                # Honor each pair of caller-supplied masks independently,
+                # generating fresh masks for whichever product lacks them.
+                remaining_bits = self.field.bits - encoding.precision
+                if mask1 is None or rem1 is None:
+                    _, mask1 = self.random_bitwise_secret(bits=encoding.precision, shape=rhs.storage.shape)
+                    _, rem1 = self.random_bitwise_secret(bits=remaining_bits, shape=rhs.storage.shape)
+                if mask2 is None or rem2 is None:
+                    _, mask2 = self.random_bitwise_secret(bits=encoding.precision, shape=lhs.storage.shape)
+                    _, rem2 = self.random_bitwise_secret(bits=remaining_bits, shape=lhs.storage.shape)
+                trunc_mask = AdditiveArrayShare(numpy.stack((mask1.storage, mask2.storage)))
+                rem_mask = AdditiveArrayShare(numpy.stack((rem1.storage, rem2.storage)))
+                products = self.right_shift(products, bits=encoding.precision, trunc_mask=trunc_mask, rem_mask=rem_mask)
             else:
-                rhsmasked = self.right_shift(rhsmasked, bits=encoding.precision)
+                products = self.right_shift(products, bits=encoding.precision)
+            rhsmasked = AdditiveArrayShare(products.storage[0, ...])
+            almost_there = AdditiveArrayShare(products.storage[1, ...])
             revealrhsmasked = self.reveal(rhsmasked, encoding=encoding)
-            if mask2 != None and rem2 != None:
-                almost_there = self.right_shift(self.field_multiply(lhs, rmask), bits=encoding.precision, trunc_mask=mask2, rem_mask=rem2)
-            else:
-                almost_there = self.right_shift(self.field_multiply(lhs, rmask), bits=encoding.precision)
             divisor = encoding.encode(numpy.array(1 / revealrhsmasked), self.field)
             quotient = AdditiveArrayShare(self.field.multiply(almost_there.storage, divisor))
-            if mask3 != None and rem3 != None:
+            if mask3 is not None and rem3 is not None:
                 return self.right_shift(quotient, bits=encoding.precision, trunc_mask=mask3, rem_mask=rem3)
             else:
                 return self.right_shift(quotient, bits=encoding.precision)
 
         # Private-public division.
         if isinstance(lhs, AdditiveArrayShare) and isinstance(rhs, numpy.ndarray):
-            if rhs == numpy.zeros_like(rhs):
+            if numpy.any(rhs == 0):
                 raise ZeroDivisionError()
-            divisor = encoding.encode(numpy.array(1 / rhs), self.field)
+            # Dividing a zero-dimensional array produces a scalar, so we only
+            # wrap the reciprocal when necessary.
+            divisor = encoding.encode(numpy.asarray(1 / rhs), self.field)
             result = self.field_multiply(lhs, divisor)
             result = self.right_shift(result, bits=encoding.precision)
             return result
@@ -445,6 +511,52 @@ class AdditiveProtocolSuite(object):
         return self.logical_not(self.field_power(diff, self.field.order - 1))
 
 
+    def _exchange_terms(self, x, y):
+        """Distribute the terms of a private-private product to the other players.
+
+        To multiply using additive shares X and Y, we need to compute the
+        following polynomial:
+
+           (X0 + X1 + ... Xn-1)(Y0 + Y1 + ... Yn-1)
+
+        To do so, we carefully share the terms of the polynomial with the
+        other players while ensuring that no one player receives every share
+        of either secret.  Each player multiplies and sums the terms that
+        they have on hand, producing an additive share of the result.
+
+        Each player's shares of both operands travel together in a single
+        message, and are sent and received without blocking, so callers can
+        compute with their local terms while the other players' terms are in
+        transit.
+
+        Note
+        ----
+        This is a collective operation that *must* be called
+        by all players that are members of :attr:`communicator`.
+
+        Parameters
+        ----------
+        x: :class:`numpy.ndarray`, required
+            This player's share of the first operand.
+        y: :class:`numpy.ndarray`, required
+            This player's share of the second operand.
+
+        Returns
+        -------
+        terms: :class:`list`
+            Result objects returned by
+            :meth:`~cicada.communicator.interface.Communicator.irecv`, each of
+            which will contain a tuple of shares of the first and second
+            operands received from another player.
+        """
+        # Send our terms to the other players.
+        for dst in self._multiply_dst[self.communicator.rank]:
+            self.communicator.isend(value=(x, y), dst=dst, tag=Tag.MULTIPLY)
+
+        # Start receiving terms from the other players.
+        return [self.communicator.irecv(src=src, tag=Tag.MULTIPLY) for src in self._multiply_src]
+
+
     @property
     def field(self):
         """Integer :any:`Field` used for arithmetic on and storage of secret shared values."""
@@ -522,9 +634,30 @@ class AdditiveProtocolSuite(object):
             Secret-shared dot product of `lhs` and `rhs`.
         """
         self._assert_binary_compatible(lhs, rhs, "lhs", "rhs")
-        result = self.field_multiply(lhs, rhs)
-        result = self.sum(result)
-        return result
+
+        # Exchange terms exactly as we would for field_multiply(), but reduce
+        # the terms we have on-hand directly to a scalar, without producing
+        # an intermediate elementwise product.  As with field_multiply(),
+        # the local dot product is computed while the other players' terms
+        # are in transit, and summing their terms as they arrive means that
+        # only two more dot products are needed, followed by a single
+        # modular reduction.
+        x = lhs.storage.ravel()
+        y = rhs.storage.ravel()
+        terms = self._exchange_terms(x, y)
+
+        result = numpy.dot(x, y)
+        other_xs = 0
+        other_ys = 0
+        for term in terms:
+            term.wait()
+            other_x, other_y = term.value
+            other_xs = other_xs + other_x
+            other_ys = other_ys + other_y
+        if terms:
+            result = result + numpy.dot(x, other_ys) + numpy.dot(other_xs, y)
+
+        return AdditiveArrayShare(numpy.array(result % self.field.order, dtype=self.field.dtype))
 
 
     def field_multiply(self, lhs, rhs):
@@ -558,48 +691,31 @@ class AdditiveProtocolSuite(object):
         """
         # Private-private multiplication.
         if isinstance(lhs, AdditiveArrayShare) and isinstance(rhs, AdditiveArrayShare):
-            # To multiply using additive shares X and Y, we need to compute the
-            # following polynomial:
-            #
-            #    (X0 + X1 + ... Xn-1)(Y0 + Y1 + ... Yn-1)
-            #
-            # To do so, we carefully share the terms of the polynomial with the
-            # other players while ensuring that no one player receives every share
-            # of either secret.  Each player multiplies and sums the terms that
-            # they have on hand, producing an additive share of the result.
-
-            rank = self.communicator.rank
-            world_size = self.communicator.world_size
-            count = math.ceil((world_size - 1) / 2)
             x = lhs.storage
             y = rhs.storage
-            X = [] # Storage for shares received from other players.
-            Y = [] # Storage for shares received from other players.
-
-            # Distribute terms to the other players.
-            for src in self.communicator.ranks:
-                # Identify which players will receive terms.
-                if world_size % 2 == 0 and src >= count:
-                    dst = numpy.arange(src + 1, src + 1 + count - 1) % world_size
-                else:
-                    dst = numpy.arange(src + 1, src + 1 + count) % world_size
-
-                # Send terms to the other players.
-                values = [x] * len(dst) if src == rank else None
-                share = self.communicator.scatterv(src=src, dst=dst, values=values)
-                if rank in dst:
-                    X.append(share)
-                values = [y] * len(dst) if src == rank else None
-                share = self.communicator.scatterv(src=src, dst=dst, values=values)
-                if rank in dst:
-                    Y.append(share)
-
-            # Multiply the polynomial terms that we have on-hand.
-            result = x * y
-            for other_x, other_y in zip(X, Y):
-                result += x * other_y + other_x * y
+            terms = self._exchange_terms(x, y)
 
-            return AdditiveArrayShare(numpy.array(result % self.field.order, dtype=self.field.dtype))
+            # Multiply the terms we have on-hand while the other players'
+            # terms are still arriving, then sum their terms as they arrive,
+            # so the remainder of the polynomial x * sum(Y) + sum(X) * y
+            # needs just two more elementwise products, no matter how many
+            # terms we receive.
+            result = x * y
+            other_xs = 0
+            other_ys = 0
+            for term in terms:
+                term.wait()
+                other_x, other_y = term.value
+                other_xs = other_xs + other_x
+                other_ys = other_ys + other_y
+            if terms:
+                result = result + x * other_ys + other_xs * y
+
+            # The product is a fresh array (or a Python int, for
+            # zero-dimensional operands), so we can reduce it in-place and
+            # wrap it without another copy.
+            result %= self.field.order
+            return AdditiveArrayShare(numpy.asarray(result, dtype=self.field.dtype))
 
         # Public-private multiplication.
         if isinstance(lhs, numpy.ndarray) and isinstance(rhs, AdditiveArrayShare):
@@ -636,23 +752,59 @@ class AdditiveProtocolSuite(object):
         result: :class:`AdditiveArrayShare`
             Secret-shared result of raising `lhs` to the power(s) in `rhs`.
         """
-        if isinstance(lhs, AdditiveArrayShare) and isinstance(rhs, (numpy.ndarray, int)):
-            if isinstance(rhs, int):
-                rhs = self.field.full_like(lhs.storage, rhs)
-
-            ans = []
-            for lhse, rhse in numpy.nditer([lhs.storage, rhs], flags=(["refs_ok"])):
-                rhsbits = [int(x) for x in bin(int(rhse))[2:]][::-1]
-                tmp = AdditiveArrayShare(lhse)
-                it_ans = self.share(src = 0, secret=self.field.full_like(lhse, 1), shape=lhse.shape, encoding=Identity())
-                limit = len(rhsbits)-1
-                for i, bit in enumerate(rhsbits):
-                    if bit:
-                        it_ans = self.field_multiply(it_ans, tmp)
-                    if i < limit:
-                        tmp = self.field_multiply(tmp,tmp)
-                ans.append(it_ans)
-            return AdditiveArrayShare(numpy.array([x.storage for x in ans], dtype=self.field.dtype).reshape(lhs.storage.shape))
+        if isinstance(lhs, AdditiveArrayShare) and isinstance(rhs, int):
+            if rhs < 0:
+                raise ValueError(f"Expected non-negative power, got {rhs} instead.") # pragma: no cover
+
+            # Raise every element to the same power, using exponentiation by
+            # squaring on the entire array at once.
+            result = None
+            value = lhs
+            while rhs:
+                if rhs & 1:
+                    result = value if result is None else self.field_multiply(result, value)
+                rhs >>= 1
+                if rhs:
+                    value = self.field_multiply(value, value)
+
+            # Never hand back the caller's share when no multiplication was done.
+            if result is lhs:
+                result = AdditiveArrayShare(lhs.storage.copy())
+            # Anything raised to the zeroth power is one.
+            if result is None:
+                if self.communicator.rank == 0:
+                    result = AdditiveArrayShare(self.field.ones_like(lhs.storage))
+                else:
+                    result = AdditiveArrayShare(self.field.zeros_like(lhs.storage))
+            return result
+
+        if isinstance(lhs, AdditiveArrayShare) and isinstance(rhs, numpy.ndarray):
+            # Sweep the bits of every exponent at once, only accumulating
+            # products for the elements whose exponent has the current bit
+            # set.  Since the exponents are public, this doesn't leak.
+            rhs = numpy.array([int(exponent) for exponent in numpy.broadcast_to(rhs, lhs.storage.shape).flat], dtype=object).reshape(lhs.storage.shape)
+            if numpy.any(rhs < 0):
+                raise ValueError(f"Expected non-negative powers, got {rhs} instead.") # pragma: no cover
+
+            # A common exponent doesn't need per-element selection, and
+            # skips the initial multiplication by one.
+            if rhs.size and numpy.all(rhs == rhs.flat[0]):
+                return self.field_power(lhs, rhs.flat[0])
+
+            if self.communicator.rank == 0:
+                result = AdditiveArrayShare(self.field.ones_like(lhs.storage))
+            else:
+                result = AdditiveArrayShare(self.field.zeros_like(lhs.storage))
+            value = lhs
+            while numpy.any(rhs):
+                bit = numpy.array(rhs & 1, dtype=bool)
+                if numpy.any(bit):
+                    product = self.field_multiply(result, value)
+                    result = AdditiveArrayShare(numpy.where(bit, product.storage, result.storage))
+                rhs >>= 1
+                if numpy.any(rhs):
+                    value = self.field_multiply(value, value)
+            return result
 
         raise NotImplementedError(f"Privacy-preserving exponentiation not implemented for the given types: {type(lhs)} and {type(rhs)}.") # pragma: no cover
 
@@ -742,6 +894,34 @@ class AdditiveProtocolSuite(object):
         return AdditiveArrayShare(self.field.uniform(size=shape, generator=generator))
 
 
+    def _finish_reveal(self, share, pending):
+        """Finish revealing a secret shared array started by :meth:`_start_reveal`.
+
+        Note
+        ----
+        This is a collective operation that *must* be called
+        by all players that are members of :attr:`communicator`.
+
+        Parameters
+        ----------
+        share: :class:`AdditiveArrayShare`, required
+            The local share that was passed to :meth:`_start_reveal`.
+        pending: :class:`list`, required
+            The value returned by :meth:`_start_reveal`.
+
+        Returns
+        -------
+        value: :class:`numpy.ndarray`
+            The revealed field values.
+        """
+        # Sum the shares as they arrive, and reduce once at the end.
+        secret = share.storage.copy()
+        for received_share in pending:
+            received_share.wait()
+            secret += received_share.value
+        return numpy.array(secret % self.field.order, dtype=self.field.dtype)
+
+
     def floor(self, operand, *, encoding=None):
         """Privacy-preserving elementwise floor of encoded, secret-shared arrays.
 
@@ -766,19 +946,15 @@ class AdditiveProtocolSuite(object):
         self._assert_unary_compatible(operand, "operand")
         encoding = self._require_encoding(encoding)
 
-        one = self.share(src=0, secret=self.field.full_like(operand.storage, 2**encoding.precision), shape=operand.storage.shape, encoding=Identity())
-        shift_op = self.field.full_like(operand.storage, 2**encoding.precision)
-        pl2 = self.field.full_like(operand.storage, self.field.order-1)
+        shift_op = numpy.array(2**encoding.precision, dtype=self.field.dtype)
 
         abs_op = self.absolute(operand)
-        frac_bits = encoding.precision
-        field_bits = self.field.bits
         lsbs = self.bit_decompose(abs_op, bits=encoding.precision)
         lsbs_composed = self.bit_compose(lsbs)
         lsbs_inv = self.negative(lsbs_composed)
-        two_lsbs = AdditiveArrayShare(self.field.multiply(lsbs_composed.storage, self.field.full_like(lsbs_composed.storage, 2)))
+        two_lsbs = self.field_add(lsbs_composed, lsbs_composed)
         ltz = self.less_zero(operand)
-        ones2sub = AdditiveArrayShare(self.field.multiply(self.field_power(lsbs_composed, pl2).storage, shift_op))
+        ones2sub = AdditiveArrayShare(self.field.multiply(self.field_power(lsbs_composed, self.field.order-1).storage, shift_op))
         sel_2_lsbs = self.field_multiply(self.field_subtract(two_lsbs, ones2sub), ltz)
         return self.field_add(self.field_add(sel_2_lsbs, lsbs_inv), operand)
 
@@ -809,21 +985,19 @@ class AdditiveProtocolSuite(object):
         """
         self._assert_binary_compatible(lhs, rhs, "lhs", "rhs")
 
-        one = self.field.full_like(lhs.storage, 1)
-        two = self.field.full_like(lhs.storage, 2)
-        twolhs = self.field_multiply(two, lhs)
-        tworhs = self.field_multiply(two, rhs)
         diff = self.field_subtract(lhs, rhs)
-        twodiff = self.field_multiply(two, diff)
-        w = self.field_subtract(one, self._lsb(twolhs))
-        x = self.field_subtract(one, self._lsb(tworhs))
-        y = self.field_subtract(one, self._lsb(twodiff))
-        wxorx = self.logical_xor(w,x)
-        notwxorx = self.field_subtract(one, wxorx)
-        xwxorx = self.field_multiply(x, wxorx)
-        noty = self.field_subtract(one, y)
-        notwxorxnoty = self.field_multiply(notwxorx, noty)
-        return self.field_add(xwxorx, notwxorxnoty)
+        # Double lhs, rhs, and their difference with one local multiplication,
+        # then extract all three least significant bits with a single _lsb call.
+        operands = AdditiveArrayShare(numpy.stack((lhs.storage, rhs.storage, diff.storage)))
+        lsbs = self._lsb(self.field_multiply(self._two, operands))
+        lsbx = AdditiveArrayShare(lsbs.storage[1, ...])
+        x = self.field_subtract(self._one, lsbx)
+        noty = AdditiveArrayShare(lsbs.storage[2, ...])
+        # Negating both inputs doesn't change their xor, so w ^ x can be
+        # computed directly from the least significant bits.
+        wxorx = self.logical_xor(AdditiveArrayShare(lsbs.storage[0, ...]), lsbx)
+        # x * (w ^ x) + (1 - (w ^ x)) * (1 - y) == (1 - y) + (w ^ x) * (x + y - 1)
+        return self.field_add(noty, self.field_multiply(wxorx, self.field_subtract(x, noty)))
 
 
     def less_zero(self, operand):
@@ -851,8 +1025,7 @@ class AdditiveProtocolSuite(object):
             Secret-shared comparison :math:`operand \lt 0`.
         """
         self._assert_unary_compatible(operand, "operand")
-        two = self.field.full_like(operand.storage, 2)
-        result = self.field_multiply(two, operand)
+        result = self.field_multiply(self._two, operand)
         return self._lsb(result)
 
 
@@ -909,7 +1082,7 @@ class AdditiveProtocolSuite(object):
             Secret-shared elementwise logical NOT of `operand`.
         """
         self._assert_unary_compatible(operand, "operand")
-        return self.field_subtract(self.field.ones_like(operand.storage), operand)
+        return self.field_subtract(self._one, operand)
 
 
     def logical_or(self, lhs, rhs):
@@ -938,9 +1111,10 @@ class AdditiveProtocolSuite(object):
             Secret-shared elementwise logical OR of `lhs` and `rhs`.
         """
         self._assert_binary_compatible(lhs, rhs, "lhs", "rhs")
-        total = self.field_add(lhs, rhs)
+        # lhs + rhs - lhs * rhs, reduced once after the multiplication.
         product = self.field_multiply(lhs, rhs)
-        return self.field_subtract(total, product)
+        result = lhs.storage + rhs.storage - product.storage
+        return AdditiveArrayShare(numpy.array(result % self.field.order, dtype=self.field.dtype))
 
 
     def logical_xor(self, lhs, rhs):
@@ -969,13 +1143,13 @@ class AdditiveProtocolSuite(object):
             Secret-shared elementwise logical XOR of `lhs` and `rhs`.
         """
         self._assert_binary_compatible(lhs, rhs, "lhs", "rhs")
-        total = self.field_add(lhs, rhs)
+        # lhs + rhs - 2 * lhs * rhs, reduced once after the multiplication.
         product = self.field_multiply(lhs, rhs)
-        twice_product = self.field_multiply(self.field(2), product)
-        return self.field_subtract(total, twice_product)
+        result = lhs.storage + rhs.storage - 2 * product.storage
+        return AdditiveArrayShare(numpy.array(result % self.field.order, dtype=self.field.dtype))
 
 
-    def _lsb(self, operand):
+    def _lsb(self, operand, *, mask_bits=None, mask=None):
         """Return the elementwise least significant bit of a secret shared array.
 
         When revealed, the result will contain the values `0` or `1`, which do
@@ -990,6 +1164,19 @@ class AdditiveProtocolSuite(object):
         ----------
         operand: :class:`AdditiveArrayShare`, required
             Secret shared array from which the least significant bits will be extracted
+        mask_bits: :class:`AdditiveArrayShare`, optional
+            Precomputed random bits, as returned by :meth:`random_bitwise_secret`,
+            with one row of :attr:`field` bits for each element of the flattened
+            `operand`.  Must be used with `mask`, and never reused.
+        mask: :class:`AdditiveArrayShare`, optional
+            Precomputed random values composed from `mask_bits`.  Must be
+            used with `mask_bits`; new masks are generated if neither is
+            specified.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If only one of `mask_bits` and `mask` is specified.
 
         Returns
         -------
@@ -997,24 +1184,30 @@ class AdditiveProtocolSuite(object):
             Additive shared array containing the elementwise least significant
             bits of `operand`.
         """
-        one = numpy.array(1, dtype=self.field.dtype)
-        lop = AdditiveArrayShare(operand.storage.flatten())
-        tmpBW, tmp = self.random_bitwise_secret(bits=self.field.bits, shape=lop.storage.shape)
+        if (mask_bits is None) != (mask is None):
+            raise ValueError("Expected mask_bits and mask to be specified together.") # pragma: no cover
+
+        lop = AdditiveArrayShare(operand.storage.reshape(-1))
+        if mask_bits is None:
+            tmpBW, tmp = self.random_bitwise_secret(bits=self.field.bits, shape=lop.storage.shape)
+        else:
+            tmpBW, tmp = mask_bits, mask
         maskedlop = self.field_add(lop, tmp)
-        c = self.reveal(maskedlop, encoding=Identity())
+        pending = self._start_reveal(maskedlop)
+        # While the masked values are in transit, prepare both choices for
+        # XOR-ing the public lsb of the masked values with the shared lsb of
+        # the mask: where the public bit is set, the result is one minus the
+        # mask bit, so we negate our share and player 0 also adds the one.
+        r0 = tmpBW.storage[:, -1]
+        if self.communicator.rank == 0:
+            not_r0 = self.field.subtract(self._one, r0)
+        else:
+            not_r0 = self.field.negative(r0)
+        c = self._finish_reveal(maskedlop, pending)
         comp_result = self._public_bitwise_less_than(lhspub=c, rhs=tmpBW)
-        c = (c % 2)
-        c0xr0 = numpy.empty(c.shape, dtype = self.field.dtype)
-        for i, lc in enumerate(c):
-            if lc:
-                c0xr0[i] = self.field_subtract(lhs=one, rhs=AdditiveArrayShare(numpy.array(tmpBW.storage[i][-1], dtype=self.field.dtype))).storage
-            else:
-                c0xr0[i] = tmpBW.storage[i][-1]
-        c0xr0 = AdditiveArrayShare(c0xr0)
-        result = self.field_multiply(lhs=comp_result, rhs=c0xr0)
-        result = AdditiveArrayShare(self.field.multiply(lhs=self.field.full_like(result.storage, 2), rhs=result.storage))
-        result = self.field_subtract(lhs=c0xr0, rhs=result)
-        result = self.field_add(lhs=comp_result, rhs=result)
+        c0 = numpy.array(c & 1, dtype=bool)
+        c0xr0 = AdditiveArrayShare(numpy.where(c0, not_r0, r0))
+        result = self.logical_xor(comp_result, c0xr0)
         return AdditiveArrayShare(result.storage.reshape(operand.storage.shape))
 
 
@@ -1043,12 +1236,45 @@ class AdditiveProtocolSuite(object):
             Secret-shared elementwise maximum of `lhs` and `rhs`.
         """
         self._assert_binary_compatible(lhs, rhs, "lhs", "rhs")
-        max_share = self.field_add(self.field_add(lhs, rhs), self.absolute(self.field_subtract(lhs, rhs)))
-        shift_right = self.field.full_like(lhs.storage, pow(2, self.field.order-2, self.field.order))
-        max_share = self.field_multiply(max_share, shift_right)
+        min_share, max_share = self.min_max(lhs, rhs)
         return max_share
 
 
+    def min_max(self, lhs, rhs):
+        """Privacy-preserving elementwise minimum and maximum of secret shared arrays.
+
+        This is equivalent to calling :meth:`minimum` and :meth:`maximum`,
+        but computes the absolute difference of the operands only once.
+        Note: the magnitude of the field elements should be less than one
+        quarter of the field order for this method to be accurate in general.
+
+        Note
+        ----
+        This is a collective operation that *must* be called
+        by all players that are members of :attr:`communicator`.
+
+        Parameters
+        ----------
+        lhs: :class:`AdditiveArrayShare`, required
+            Secret shared operand.
+        rhs: :class:`AdditiveArrayShare`, required
+            Secret shared operand.
+
+        Returns
+        -------
+        min_share: :class:`AdditiveArrayShare`
+            Secret-shared elementwise minimum of `lhs` and `rhs`.
+        max_share: :class:`AdditiveArrayShare`
+            Secret-shared elementwise maximum of `lhs` and `rhs`.
+        """
+        self._assert_binary_compatible(lhs, rhs, "lhs", "rhs")
+        total = self.field_add(lhs, rhs)
+        abs_diff = self.absolute(self.field_subtract(lhs, rhs))
+        min_share = AdditiveArrayShare(self.field.multiply(self.field_subtract(total, abs_diff).storage, self._half))
+        max_share = AdditiveArrayShare(self.field.multiply(self.field_add(total, abs_diff).storage, self._half))
+        return min_share, max_share
+
+
     def minimum(self, lhs, rhs):
         """Privacy-preserving elementwise minimum of secret shared arrays.
 
@@ -1074,11 +1300,7 @@ class AdditiveProtocolSuite(object):
             Secret-shared elementwise minimum of `lhs` and `rhs`.
         """
         self._assert_binary_compatible(lhs, rhs, "lhs", "rhs")
-        diff = self.field_subtract(lhs, rhs)
-        abs_diff = self.absolute(diff)
-        min_share = self.field_subtract(self.field_add(lhs, rhs), abs_diff)
-        shift_right = self.field.full_like(lhs.storage, pow(2, self.field.order-2, self.field.order))
-        min_share = self.field_multiply(min_share, shift_right)
+        min_share, max_share = self.min_max(lhs, rhs)
         return min_share
 
 
@@ -1117,8 +1339,11 @@ class AdditiveProtocolSuite(object):
         mask = self.field_uniform(shape=operand.storage.shape)
         masked_op = self.field_multiply(mask, operand)
         revealed_masked_op = self.reveal(masked_op, encoding=Identity())
-        nppowmod = numpy.vectorize(lambda a, b, c: pow(int(a), int(b), int(c)), otypes=[self.field.dtype])
-        inv = numpy.array(nppowmod(revealed_masked_op, self.field.order-2, self.field.order), dtype=self.field.dtype)
+        # Python computes modular inverses directly, which is much faster than
+        # Fermat exponentiation.  Zero has no inverse, so it maps to zero as
+        # it would with Fermat.
+        order = self.field.order
+        inv = numpy.array([pow(value, -1, order) if value else 0 for value in revealed_masked_op.flat], dtype=self.field.dtype).reshape(revealed_masked_op.shape)
         op_inv_share = self.field.multiply(inv, mask.storage)
         return AdditiveArrayShare(op_inv_share)
 
@@ -1204,7 +1429,7 @@ class AdditiveProtocolSuite(object):
             Secret-shared elementwise additive inverse of `operand`.
         """
         self._assert_unary_compatible(operand, "operand")
-        return self.field_subtract(self.field.full_like(operand.storage, self.field.order), operand)
+        return AdditiveArrayShare(self.field.negative(operand.storage))
 
 
 #    def pade_approx(self, func, operand, *, encoding=None, center=0, degree=12, scale=3):
@@ -1239,29 +1464,18 @@ class AdditiveProtocolSuite(object):
 #
 #        func_taylor = approximate_taylor_polynomial(func, center, degree, scale)
 #        func_pade_num, func_pade_den = pade([x for x in func_taylor][::-1], den_deg, n=num_deg)
-#        enc_func_pade_num = encoding.encode(numpy.array([x for x in func_pade_num]), self.field)
-#        enc_func_pade_den = encoding.encode(numpy.array([x for x in func_pade_den]), self.field)
-#
-#        result_list=[]
-#        for op in operand.storage:
-#            single_op_share = AdditiveArrayShare(numpy.array(op, dtype=object))
-#            op_pows_num_list = [self.share(src=1, secret=numpy.array(1), shape=())]
-#            for i in range(num_deg):
-#                op_pows_num_list.append(self.multiply(single_op_share, op_pows_num_list[-1]))
-#            if degree%2:
-#                op_pows_den_list=[thing for thing in op_pows_num_list[:-1]]
-#            else:
-#                op_pows_den_list=[thing for thing in op_pows_num_list]
-#            op_pows_num = AdditiveArrayShare(numpy.array([x.storage for x in op_pows_num_list]))
-#            op_pows_den = AdditiveArrayShare(numpy.array([x.storage for x in op_pows_den_list]))
 #
-#            result_num_prod = self.field_multiply(op_pows_num, enc_func_pade_num)
-#            result_num = self.right_shift(self.sum(result_num_prod), bits=encoding.precision)
+#        # Evaluate numerator and denominator for every element at once using
+#        # Horner's method, rather than building per-element lists of powers.
+#        def horner(coefficients):
+#            shape = operand.storage.shape
+#            result = self.share(src=0, secret=numpy.full(shape, coefficients[0]), shape=shape, encoding=encoding)
+#            for coefficient in coefficients[1:]:
+#                result = self.multiply(result, operand, encoding=encoding)
+#                result = self.add(result, numpy.array(coefficient), encoding=encoding)
+#            return result
 #
-#            result_den_prod = self.field_multiply(op_pows_den, enc_func_pade_den)
-#            result_den = self.right_shift(self.sum(result_den_prod), bits=encoding.precision)
-#            result_list.append(self.divide(result_num, result_den))
-#        return AdditiveArrayShare(numpy.array([s.storage for s in result_list], dtype=object))
+#        return self.divide(horner(func_pade_num.coeffs), horner(func_pade_den.coeffs), encoding=encoding)
 
 
     def power(self, lhs, rhs, *, encoding=None):
@@ -1296,36 +1510,81 @@ class AdditiveProtocolSuite(object):
         encoding = self._require_encoding(encoding)
 
         if isinstance(lhs, AdditiveArrayShare) and isinstance(rhs, numpy.ndarray):
-            results=[]
-            with numpy.nditer([lhs.storage, rhs], flags=["refs_ok"]) as iterator:
-                for value, power in iterator:
-                    value = AdditiveArrayShare(value)
-                    result = self.share(src=0, secret=numpy.array(1.0), shape=(), encoding=encoding)
-
-#                    # Naive implementation performs n multiplications when raising to the n-th power.
-#                    for i in range(power):
-#                        result = self.field_multiply(result, value)
-#                        result = self.right_shift(result, bits=encoding.precision)
-
-                    # Fancy implementation performs exponentiation by squaring.
-                    while True:
-                        if power & 1:
+            rhs = numpy.array([int(exponent) for exponent in numpy.broadcast_to(rhs, lhs.storage.shape).flat], dtype=object).reshape(lhs.storage.shape)
+            if numpy.any(rhs < 0):
+                raise ValueError(f"Expected non-negative powers, got {rhs} instead.") # pragma: no cover
+
+            # When every element is raised to the same positive power, we
+            # can start from the first product instead of from one, which
+            # saves a multiplication and a truncation.
+            if rhs.size and rhs.flat[0] and numpy.all(rhs == rhs.flat[0]):
+                power = rhs.flat[0]
+                result = None
+                value = lhs
+                while power:
+                    if power & 1:
+                        if result is None:
+                            result = value
+                        else:
                             result = self.field_multiply(result, value)
                             result = self.right_shift(result, bits=encoding.precision)
-
-                        if not power:
-                            break
-
+                    power >>= 1
+                    if power:
                         value = self.field_multiply(value, value)
                         value = self.right_shift(value, bits=encoding.precision)
-                        power = power >> 1
-
-                    results.append(result)
-            return AdditiveArrayShare(numpy.array([result.storage.item() for result in results], dtype=self.field.dtype).reshape(lhs.storage.shape))
+                # Never hand back the caller's share when no multiplication was done.
+                if result is lhs:
+                    result = AdditiveArrayShare(lhs.storage.copy())
+                return result
+
+            # Otherwise, sweep the bits of every exponent at once, only
+            # accumulating products for the elements whose exponent has the
+            # current bit set.  Since the exponents are public, this doesn't
+            # leak.
+            one = encoding.encode(numpy.ones(lhs.storage.shape), self.field)
+            if self.communicator.rank == 0:
+                result = AdditiveArrayShare(one)
+            else:
+                result = AdditiveArrayShare(self.field.zeros_like(one))
+            value = lhs
+            while numpy.any(rhs):
+                bit = numpy.array(rhs & 1, dtype=bool)
+                if numpy.any(bit):
+                    product = self.field_multiply(result, value)
+                    product = self.right_shift(product, bits=encoding.precision)
+                    result = AdditiveArrayShare(numpy.where(bit, product.storage, result.storage))
+                rhs >>= 1
+                if numpy.any(rhs):
+                    value = self.field_multiply(value, value)
+                    value = self.right_shift(value, bits=encoding.precision)
+            return result
 
         raise NotImplementedError(f"Privacy-preserving exponentiation not implemented for the given types: {type(lhs)} and {type(rhs)}.") # pragma: no cover
 
 
+    def _powers_of_two(self, bits):
+        """Return the field weights used to compose bits in big-endian order.
+
+        The weights only depend on the number of bits, so they are cached.
+
+        Parameters
+        ----------
+        bits: :class:`int`, required
+            Number of bits to be composed.
+
+        Returns
+        -------
+        weights: :class:`numpy.ndarray`
+            Field array containing :math:`2^{bits-1}, \\dots, 2, 1`.
+        """
+        if bits not in self._bit_shifts:
+            shifts = numpy.array([pow(2, bits - 1 - i, self.field.order) for i in range(bits)], dtype=self.field.dtype)
+            # The cached weights are shared by every caller.
+            shifts.flags.writeable = False
+            self._bit_shifts[bits] = shifts
+        return self._bit_shifts[bits]
+
+
     def _public_bitwise_less_than(self, *, lhspub, rhs):
         """Comparison Operator
 
@@ -1351,43 +1610,44 @@ class AdditiveProtocolSuite(object):
         if lhspub.shape != rhs.storage.shape[:-1]:
             raise ValueError('rhs is not of the expected shape - it should be the same as lhs except the last dimension') # pragma: no cover
         bitwidth = rhs.storage.shape[-1]
-        lhsbits = []
-        for val in lhspub:
-            tmplist = [int(x) for x in bin(val)[2:]]
-            if len(tmplist) < bitwidth:
-                tmplist = [0 for x in range(bitwidth-len(tmplist))] + tmplist
-            lhsbits.append(tmplist)
-        lhsbits = numpy.array(lhsbits, dtype=self.field.dtype)
-        assert(lhsbits.shape == rhs.storage.shape)
-        one = numpy.array(1, dtype=self.field.dtype)
-        flatlhsbits = lhsbits.reshape((-1, lhsbits.shape[-1]))
-        flatrhsbits = rhs.storage.reshape((-1, rhs.storage.shape[-1]))
-        results=[]
-        for j in range(len(flatlhsbits)):
-            xord = []
-            preord = []
-            msbdiff=[]
-            rhs_bit_at_msb_diff = []
-            for i in range(bitwidth):
-                rhsbit=AdditiveArrayShare(storage=numpy.array(flatrhsbits[j,i], dtype=self.field.dtype))
-                if flatlhsbits[j][i] == 1:
-                    xord.append(self.field_subtract(lhs=one, rhs=rhsbit))
-                else:
-                    xord.append(rhsbit)
-            preord = [xord[0]]
-            for i in range(1,bitwidth):
-                preord.append(self.logical_or(lhs=preord[i-1], rhs=xord[i]))
-            msbdiff = [preord[0]]
-            for i in range(1,bitwidth):
-                msbdiff.append(self.field_subtract(lhs=preord[i], rhs=preord[i-1]))
-            for i in range(bitwidth):
-                rhsbit=AdditiveArrayShare(storage=numpy.array(flatrhsbits[j,i], dtype=self.field.dtype))
-                rhs_bit_at_msb_diff.append(self.field_multiply(rhsbit, msbdiff[i]))
-            result = rhs_bit_at_msb_diff[0]
-            for i in range(1,bitwidth):
-                result = self.field_add(lhs=result, rhs=rhs_bit_at_msb_diff[i])
-            results.append(result)
-        return AdditiveArrayShare(numpy.array([x.storage for x in results], dtype=self.field.dtype).reshape(rhs.storage.shape[:-1]))
+        # Extract the public bits in big-endian order.  The values may be
+        # larger than 64 bits, so we shift Python integers instead of
+        # converting to a fixed-width dtype.
+        shifts = numpy.arange(bitwidth - 1, -1, -1).astype(self.field.dtype)
+        lhsbits = (numpy.asarray(lhspub, dtype=self.field.dtype)[..., None] >> shifts) & 1
+        flatlhsbits = lhsbits.reshape((-1, bitwidth))
+        flatrhsbits = rhs.storage.reshape((-1, bitwidth))
+
+        # XOR the public bits with the shared bits for every value at once.
+        # Where a public bit is set the result is one minus the shared bit,
+        # so we negate our share and player 0 also adds the one.
+        if self.communicator.rank == 0:
+            notrhsbits = self.field.subtract(self._one, flatrhsbits)
+        else:
+            notrhsbits = self.field.negative(flatrhsbits)
+        xord = AdditiveArrayShare(numpy.where(flatlhsbits, notrhsbits, flatrhsbits))
+
+        # Prefix-OR from the most significant bit, using a log-depth scan:
+        # each pass ors every column with the column `shift` places before
+        # it, doubling the span covered by each column.
+        preord = xord.storage
+        shift = 1
+        while shift < bitwidth:
+            ored = self.logical_or(lhs=AdditiveArrayShare(preord[:, shift:]), rhs=AdditiveArrayShare(preord[:, :-shift]))
+            preord = numpy.concatenate((preord[:, :shift], ored.storage), axis=1)
+            shift *= 2
+
+        # Identify the most significant bit where the values differ.
+        msbdiff = preord.copy()
+        msbdiff[:, 1:] = self.field.subtract(preord[:, 1:], preord[:, :-1])
+
+        # Select the shared bit at that position.  Because the values differ
+        # there, the shared bit is the complement of the public bit, so the
+        # selection is local: lhs < rhs exactly when the first differing
+        # public bit is zero.
+        rhs_bit_at_msb_diff = numpy.where(flatlhsbits, 0, msbdiff)
+        result = numpy.sum(rhs_bit_at_msb_diff, axis=-1) % self.field.order
+        return AdditiveArrayShare(numpy.array(result, dtype=self.field.dtype).reshape(rhs.storage.shape[:-1]))
 
 
     def random_bitwise_secret(self, *, bits, shape=None, src=None, generator=None):
@@ -1443,7 +1703,6 @@ class AdditiveProtocolSuite(object):
             bits in big-endian order, with shape `shape`.
         """
         bits = int(bits)
-        shape_was_none = False
         if bits < 1:
             raise ValueError(f"bits must be a positive integer, got {bits} instead.") # pragma: no cover
 
@@ -1456,41 +1715,35 @@ class AdditiveProtocolSuite(object):
             generator = numpy.random.default_rng()
         if shape is None:
             shape = ()
-            shape_was_none = True
-        bit_res = []
-        share_res = []
-        numzeros = numpy.zeros(shape)
-        for loopop in numzeros.flat:
-            # Each participating player generates a vector of random bits.
-            if self.communicator.rank in src:
-                local_bits = generator.choice(2, size=bits).astype(self.field.dtype)
-            else:
-                local_bits = None
-
-            # Each participating player secret shares their bit vectors.
-            player_bit_shares = []
-            for rank in src:
-                player_bit_shares.append(self.share(src=rank, secret=local_bits, shape=(bits,), encoding=Identity()))
-
-            # Generate the final bit vector by xor-ing everything together elementwise.
-            bit_share = player_bit_shares[0]
-            for player_bit_share in player_bit_shares[1:]:
-                bit_share = self.logical_xor(bit_share, player_bit_share)
-
-            # Shift and combine the resulting bits in big-endian order to produce a random value.
-            shift = numpy.power(2, numpy.arange(bits, dtype=self.field.dtype)[::-1])
-            shifted = self.field.multiply(shift, bit_share.storage)
-            secret_share = AdditiveArrayShare(numpy.array(numpy.sum(shifted), dtype=self.field.dtype))
-            bit_res.append(bit_share)
-            share_res.append(secret_share)
-        if shape_was_none:
-            bit_share = AdditiveArrayShare(numpy.array([x.storage for x in bit_res], dtype=self.field.dtype).reshape(bits))
-            secret_share = AdditiveArrayShare(numpy.array([x.storage for x in share_res], dtype=self.field.dtype).reshape(shape))#, order="C"))
-        else:
-            bit_share = AdditiveArrayShare(numpy.array([x.storage for x in bit_res], dtype=self.field.dtype).reshape(shape+(bits,)))#, order="C"))
-            secret_share = AdditiveArrayShare(numpy.array([x.storage for x in share_res], dtype=self.field.dtype).reshape(shape))#, order="C"))
+        # Normalize the shape without allocating an array to do it.
+        shape = (shape,) if isinstance(shape, numbers.Integral) else tuple(shape)
 
-        return bit_share, secret_share
+        # Each participating player generates random bits for every element at once.
+        if self.communicator.rank in src:
+            local_bits = generator.integers(0, 2, size=shape + (bits,), dtype=numpy.uint8).astype(self.field.dtype)
+        else:
+            local_bits = None
+
+        # Each participating player secret shares their bits.  Sharing only
+        # requires a local pseudorandom zero-sharing, so we draw the
+        # zero-sharings for every participating player at once, then each
+        # participant adds their bits to their own row.
+        player_bits = self._przs(shape=(len(src),) + shape + (bits,))
+        if self.communicator.rank in src:
+            self.field.inplace_add(player_bits[list(src).index(self.communicator.rank)], local_bits)
+
+        # Generate the final bits by xor-ing everything together
+        # elementwise.  We xor pairs of bit arrays in a tree, stacking
+        # the pairs at each level so that it only requires a single
+        # multiplication.
+        while len(player_bits) > 1:
+            pairs = len(player_bits) // 2
+            xored = self.logical_xor(AdditiveArrayShare(player_bits[0:2*pairs:2]), AdditiveArrayShare(player_bits[1:2*pairs:2]))
+            player_bits = numpy.concatenate((xored.storage, player_bits[2*pairs:]))
+        bit_share = AdditiveArrayShare(player_bits[0])
+
+        # Shift and combine the resulting bits in big-endian order to produce random values.
+        return bit_share, self.bit_compose(bit_share)
 
 
     def relu(self, operand):
@@ -1513,9 +1766,7 @@ class AdditiveProtocolSuite(object):
         """
         self._assert_unary_compatible(operand, "operand")
         ltz = self.less_zero(operand)
-        nltz = self.logical_not(ltz)
-        nltz_parts = self.field_multiply(nltz, operand)
-        return nltz_parts
+        return self._select(ltz, self._zero, operand)
 
 
     def reshare(self, operand):
@@ -1540,14 +1791,15 @@ class AdditiveProtocolSuite(object):
             Secret-shared, re-randomized version of `operand`.
         """
         self._assert_unary_compatible(operand, "operand")
-        recshares = []
-        for i in range(self.communicator.world_size):
-            recshares.append(self.share(src=i, secret=operand.storage, shape=operand.storage.shape, encoding=Identity()))
-        acc = numpy.zeros(operand.storage.shape, dtype=self.field.dtype)
-        for s in recshares:
-            acc += s.storage
-        acc %= self.field.order
-        return AdditiveArrayShare(acc)
+        # Every player re-shares their share of the operand.  Sharing only
+        # requires a local pseudorandom zero-sharing, and each player only
+        # adds their own share, so we draw the zero-sharings for every player
+        # at once and sum them without creating intermediate shares or
+        # communicating.  Field values are arbitrary-precision integers, so
+        # the sum can't overflow and only needs to be reduced once.
+        przs = self._przs(shape=(self.communicator.world_size,) + operand.storage.shape)
+        acc = operand.storage + numpy.sum(przs, axis=0)
+        return AdditiveArrayShare(numpy.array(acc % self.field.order, dtype=self.field.dtype))
 
 
     def reveal(self, share, *, dst=None, encoding=None):
@@ -1574,25 +1826,45 @@ class AdditiveProtocolSuite(object):
         -------
         value: :class:`numpy.ndarray` or :any:`None`
             The revealed secret, if this player is a member of `dst`, or :any:`None`.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `dst` is empty, contains duplicate ranks, or contains ranks that
+            aren't members of :attr:`communicator`.
         """
         self._assert_unary_compatible(share, "share")
 
-        # Identify who will be receiving shares.
+        # Identify who will be receiving shares.  Every player validates dst
+        # before anything is sent, so an invalid recipient can't leave
+        # stray messages behind for later operations to consume.
         if dst is None:
             dst = self.communicator.ranks
+        dst = list(dst)
+        if not dst:
+            raise ValueError("Expected dst to contain at least one rank.") # pragma: no cover
+        if len(set(dst)) != len(dst):
+            raise ValueError(f"Expected dst to contain unique ranks, got {dst} instead.") # pragma: no cover
+        for recipient in dst:
+            if recipient not in self.communicator.ranks:
+                raise ValueError(f"Expected dst to contain ranks in {self.communicator.ranks}, got {recipient} instead.") # pragma: no cover
 
         encoding = self._require_encoding(encoding)
 
-        # Send data to the other players.
+        # Send data to the other players.  When everyone is a recipient, a
+        # single allgather replaces one gather per recipient.
         secret = None
-        for recipient in dst:
-            received_shares = self.communicator.gather(value=share.storage, dst=recipient)
-
-            # If we're a recipient, recover the secret.
-            if self.communicator.rank == recipient:
-                secret = received_shares[0].copy()
-                for received_share in received_shares[1:]:
-                    self.field.inplace_add(secret, received_share)
+        if set(dst) == set(self.communicator.ranks):
+            received_shares = self.communicator.allgather(value=share.storage)
+            secret = numpy.sum(numpy.stack(received_shares), axis=0)
+            secret = numpy.array(secret % self.field.order, dtype=self.field.dtype)
+        else:
+            # Otherwise, send our share directly to each recipient without
+            # blocking, so players don't wait on a gather for every recipient
+            # in turn, and only the recipients recover the secret.
+            pending = self._start_reveal(share, dst=dst)
+            if self.communicator.rank in dst:
+                secret = self._finish_reveal(share, pending)
 
         return encoding.decode(secret, self.field)
 
@@ -1638,27 +1910,39 @@ class AdditiveProtocolSuite(object):
         if not isinstance(operand, AdditiveArrayShare):
             raise ValueError(f"Expected operand to be an instance of AdditiveArrayShare, got {type(operand)} instead.") # pragma: no cover
 
-        shift_left = self.field.full_like(operand.storage, 2**bits)
-        # Multiplicative inverse of shift_left.
-        shift_right = self.field.full_like(operand.storage, pow(2**bits, self.field.order-2, self.field.order))
+        shape = operand.storage.shape
+        remaining_bits = self.field.bits - bits
 
-        if trunc_mask:
-            truncation_mask = trunc_mask
-        else:
-            # Generate random bits that will mask the region to be truncated.
-            _, truncation_mask = self.random_bitwise_secret(bits=bits, src=src, generator=generator, shape=operand.storage.shape)
-        if rem_mask:
-            remaining_mask = rem_mask
+        # Both shift constants broadcast, so they don't need to match the
+        # operand shape.
+        shift_left = numpy.array(2**bits, dtype=self.field.dtype)
+        # Multiplicative inverse of shift_left.
+        shift_right = self.field.inverse_power_of_two(bits)
+
+        if trunc_mask is None and rem_mask is None:
+            # Generate random bits that will mask the entire value with a
+            # single call.  The low-order bits mask the region to be
+            # truncated, and the high-order bits mask everything else.
+            mask_bits, mask = self.random_bitwise_secret(bits=self.field.bits, src=src, generator=generator, shape=shape)
+            truncation_mask = self.bit_compose(AdditiveArrayShare(mask_bits.storage[..., remaining_bits:]))
+            masked_element = operand.storage + mask.storage
         else:
-            # Generate random bits that will mask everything outside the region to be truncated.
-            _, remaining_mask = self.random_bitwise_secret(bits=self.field.bits-bits, src=src, generator=generator, shape=operand.storage.shape)
-        remaining_mask.storage = self.field.multiply(remaining_mask.storage, shift_left)
-
-        # Combine the two masks.
-        mask = self.field_add(remaining_mask, truncation_mask)
+            if trunc_mask is not None:
+                truncation_mask = trunc_mask
+            else:
+                # Generate random bits that will mask the region to be truncated.
+                _, truncation_mask = self.random_bitwise_secret(bits=bits, src=src, generator=generator, shape=shape)
+            if rem_mask is not None:
+                remaining_mask = rem_mask
+            else:
+                # Generate random bits that will mask everything outside the region to be truncated.
+                _, remaining_mask = self.random_bitwise_secret(bits=remaining_bits, src=src, generator=generator, shape=shape)
+            # Shift the remaining mask into place and combine both masks
+            # with the operand in a single pass.
+            masked_element = operand.storage + remaining_mask.storage * shift_left + truncation_mask.storage
 
-        # Mask the array element.
-        masked_element = self.field_add(mask, operand)
+        # Mask the array element, with a single modular reduction.
+        masked_element = AdditiveArrayShare(numpy.array(masked_element % self.field.order, dtype=self.field.dtype))
 
         # Reveal the element to all players (because it's masked, no player learns the underlying secret).
         masked_element = self.reveal(masked_element, encoding=Identity())
@@ -1671,13 +1955,45 @@ class AdditiveProtocolSuite(object):
         # secret shared, the secret still isn't revealed.
         truncation_bits = self.field_subtract(masked_truncation_bits, truncation_mask)
 
-        # Remove the bits in the truncation region from the element.  The result can be safely truncated.
-        result = self.field_subtract(operand, truncation_bits)
+        # Remove the bits in the truncation region from the element, then
+        # truncate by shifting right to get rid of the (now cleared) bits,
+        # with a single modular reduction.
+        result = (operand.storage - truncation_bits.storage) * shift_right
+        return AdditiveArrayShare(numpy.array(result % self.field.order, dtype=self.field.dtype))
 
-        # Truncate the element by shifting right to get rid of the (now cleared) bits in the truncation region.
-        result = self.field.multiply(result.storage, shift_right)
 
-        return AdditiveArrayShare(result)
+    def _select(self, condition, lhs, rhs):
+        """Elementwise branchless selection between two values.
+
+        Returns `lhs` where `condition` is one and `rhs` where `condition` is
+        zero, computed as :math:`rhs + condition (lhs - rhs)` so that only one
+        multiplication is required.
+
+        Note
+        ----
+        This is a collective operation that *must* be called
+        by all players that are members of :attr:`communicator`.
+
+        Parameters
+        ----------
+        condition: :class:`AdditiveArrayShare`, required
+            Secret shared array containing the field values :math:`0` and :math:`1`.
+        lhs: :class:`AdditiveArrayShare` or :class:`numpy.ndarray`, required
+            Secret shared or public value selected where `condition` is one.
+        rhs: :class:`AdditiveArrayShare` or :class:`numpy.ndarray`, required
+            Secret shared or public value selected where `condition` is zero.
+
+        Returns
+        -------
+        result: :class:`AdditiveArrayShare`
+            Secret-shared elementwise selection of `lhs` and `rhs`.
+        """
+        self._assert_unary_compatible(condition, "condition")
+        if isinstance(lhs, numpy.ndarray) and isinstance(rhs, numpy.ndarray):
+            diff = self.field.subtract(lhs, rhs)
+        else:
+            diff = self.field_subtract(lhs, rhs)
+        return self.field_add(rhs, self.field_multiply(condition, diff))
 
 
     def share(self, *, src, secret, shape, encoding=None):
@@ -1729,6 +2045,46 @@ class AdditiveProtocolSuite(object):
         return AdditiveArrayShare(przs)
 
 
+    def _start_reveal(self, share, *, dst=None):
+        """Begin revealing a secret shared array to a subset of players, without blocking.
+
+        Callers can perform local work that doesn't depend on the revealed
+        values, then call :meth:`_finish_reveal` to retrieve them.
+
+        Note
+        ----
+        This is a collective operation that *must* be called
+        by all players that are members of :attr:`communicator`.
+
+        Parameters
+        ----------
+        share: :class:`AdditiveArrayShare`, required
+            The local share of the secret to be revealed.
+        dst: sequence of :class:`int`, optional
+            List of players who will receive the revealed secret.  If :any:`None`
+            (the default), the secret will be revealed to all players.
+
+        Returns
+        -------
+        pending: :class:`list`
+            Result objects for the shares that will be received from the
+            other players, to be passed to :meth:`_finish_reveal`.  Empty if
+            this player isn't a member of `dst`.
+        """
+        self._assert_unary_compatible(share, "share")
+
+        if dst is None:
+            dst = self.communicator.ranks
+
+        others = [rank for rank in self.communicator.ranks if rank != self.communicator.rank]
+        for recipient in sorted(set(dst)):
+            if recipient != self.communicator.rank:
+                self.communicator.isend(value=share.storage, dst=recipient, tag=Tag.REVEAL)
+        if self.communicator.rank not in dst:
+            return []
+        return [self.communicator.irecv(src=src, tag=Tag.REVEAL) for src in others]
+
+
     def subtract(self, lhs, rhs, *, encoding=None):
         """Privacy-preserving elementwise difference of arrays.
 
@@ -1826,21 +2182,18 @@ class AdditiveProtocolSuite(object):
 #
 #        taylor_poly = approximate_taylor_polynomial(func, center, degree, scale)
 #
-#        enc_taylor_coef = encoding.encode(numpy.array([x for x in taylor_poly]), self.field)
-#        result_list=[]
-#        for op in operand.storage:
-#            single_op_share = AdditiveArrayShare(numpy.array(op, dtype=object))
-#            op_pow_list = [self.share(src=1, secret=numpy.array(1), shape=())]
-#            for i in range(degree):
-#                op_pow_list.append(self.multiply(single_op_share, op_pow_list[-1]))
-#
-#            op_pow_shares = AdditiveArrayShare(numpy.array([x.storage for x in op_pow_list]))
 #
-#            result = self.field_multiply(op_pow_shares, enc_taylor_coef)
-#            result = self.sum(result)
-#            result = self.right_shift(result, bits=encoding.precision)
-#            result_list.append(result)
-#        return AdditiveArrayShare(numpy.array([s.storage for s in result_list], dtype=object))
+#        # Evaluate the polynomial for every element at once using Horner's
+#        # method, which requires one multiplication per degree.  The
+#        # coefficients are public 0-d constants that broadcast against the
+#        # operand.
+#        coefficients = taylor_poly.coeffs
+#        shape = operand.storage.shape
+#        result = self.share(src=0, secret=numpy.full(shape, coefficients[0]), shape=shape, encoding=encoding)
+#        for coefficient in coefficients[1:]:
+#            result = self.multiply(result, operand, encoding=encoding)
+#            result = self.add(result, numpy.array(coefficient), encoding=encoding)
+#        return result
 
 
     def _verify_storage(self, operand):
@@ -1900,18 +2253,20 @@ class AdditiveProtocolSuite(object):
         self._assert_unary_compatible(operand, "operand")
         encoding = self._require_encoding(encoding)
 
-        ones = encoding.encode(numpy.full_like(operand.storage, 1.0), self.field)
-        half = encoding.encode(numpy.full_like(operand.storage, 0.5), self.field)
+        # Encoded constants broadcast against the operand.
+        ones = encoding.encode(numpy.array(1.0), self.field)
+        half = encoding.encode(numpy.array(0.5), self.field)
 
-        secret_plushalf = self.field_add(half, operand)
+        secret_plushalf = self.field_add(operand, half)
         secret_minushalf = self.field_subtract(operand, half)
-        ltzsmh = self.less_zero(secret_minushalf)
+        # Extract both signs with a single comparison.
+        ltz = self.less_zero(AdditiveArrayShare(numpy.stack((secret_minushalf.storage, secret_plushalf.storage))))
+        ltzsmh = AdditiveArrayShare(ltz.storage[0, ...])
+        ltzsph = AdditiveArrayShare(ltz.storage[1, ...])
         nltzsmh = self.logical_not(ltzsmh)
-        ltzsph = self.less_zero(secret_plushalf)
         middlins = self.field_subtract(ltzsmh, ltzsph)
-        extracted_middlins = self.field_multiply(middlins, operand)
-        extracted_halfs = self.field_multiply(middlins, half)
-        extracted_middlins = self.field_add(extracted_middlins, extracted_halfs)
+        # middlins * (operand + 0.5) reuses the already-shifted operand.
+        extracted_middlins = self.field_multiply(middlins, secret_plushalf)
         ones_part = self.field_multiply(nltzsmh, ones)
         return self.field_add(ones_part, extracted_middlins)
 
@@ -50,6 +50,8 @@ class Field(object):
         self._dtype = numpy.dtype(object)
         self._order = order
         self._bits = order.bit_length()
+        # Multiplicative inverses of powers of two, keyed by exponent.
+        self._inverse_powers_of_two = {}
 
 
     def __eq__(self, other):
@@ -184,6 +186,29 @@ class Field(object):
         lhs %= self._order
 
 
+    def inverse_power_of_two(self, bits):
+        """Return the multiplicative inverse of :math:`2^{bits}` in the field.
+
+        The inverse only depends on `bits`, so it is cached.  The result is
+        read-only, since it is shared by every caller.
+
+        Parameters
+        ----------
+        bits: :class:`int`, required
+            Exponent of the power of two to invert.
+
+        Returns
+        -------
+        inverse: :class:`numpy.ndarray`
+            Zero-dimensional field array containing :math:`2^{-bits}`.
+        """
+        if bits not in self._inverse_powers_of_two:
+            inverse = numpy.array(pow(2**bits, self._order-2, self._order), dtype=self.dtype)
+            inverse.flags.writeable = False
+            self._inverse_powers_of_two[bits] = inverse
+        return self._inverse_powers_of_two[bits]
+
+
     def _is_prob_prime(self, n):# Rabin-Miller probabalistic primality test
         """
         Miller-Rabin primality test.
@@ -364,11 +389,22 @@ class Field(object):
         random: :class:`numpy.ndarray`
             Field array containing uniform random values with shape `size`.
         """
+        # Scalars are common enough (e.g. sharing a single value) to skip the
+        # array machinery.
+        if size == ():
+            return numpy.array(int.from_bytes(generator.bytes(self.bytes), "big") % self._order, dtype=self.dtype)
+
         elements = int(numpy.prod(size))
         elementbytes = self.bytes
         randombytes = generator.bytes(elements * elementbytes)
 
-        values = [int.from_bytes(randombytes[start : start+elementbytes], "big") % self._order for start in range(0, elements * elementbytes, elementbytes)]
+        # Fields whose elements fit a native unsigned integer (including the
+        # default 64-bit field) can convert all of the bytes at once.
+        if elementbytes in (1, 2, 4, 8):
+            values = numpy.frombuffer(randombytes, dtype=f">u{elementbytes}")
+            values = (values % values.dtype.type(self._order)).astype(self.dtype)
+        else:
+            values = [int.from_bytes(randombytes[start : start+elementbytes], "big") % self._order for start in range(0, elements * elementbytes, elementbytes)]
         result = numpy.array(values, dtype=self.dtype).reshape(size)
         self._assert_unary_compatible(result, "result")
         return result
@@ -396,9 +432,12 @@ class Field(object):
             raise ValueError(f"Expected array to be an instance of numpy.ndarray, got {type(array)} instead.") # pragma: no cover
         if array.dtype != self.dtype:
             raise ValueError(f"Expected array dtype to be object, got {array.dtype} instead.") # pragma: no cover
-        for index in numpy.ndindex(array.shape):
-            if not isinstance(array[index], int):
-                raise ValueError(f"All array values must be type 'int', value at index {index} is {type(array[index])}.") # pragma: no cover
+        # Iterate over the flattened values directly, rather than indexing the
+        # array one multi-dimensional index at a time.
+        for offset, value in enumerate(array.flat):
+            if not isinstance(value, int):
+                index = tuple(int(i) for i in numpy.unravel_index(offset, array.shape))
+                raise ValueError(f"All array values must be type 'int', value at index {index} is {type(value)}.") # pragma: no cover
 
         return array
 
@@ -231,6 +231,12 @@ def main(listen_socket, communicator):
                 operand_stack.append(share.storage)
                 _send_result(client)
 
+            # Overwrite the storage of the secret share on top of the operand stack in-place, for testing.
+            elif command == "share" and kwargs["subcommand"] == "zerostorage":
+                share = operand_stack[-1]
+                share.storage.fill(0)
+                _send_result(client)
+
             #############################################################
             # Commands related to protocol suites.
 
@@ -246,8 +252,9 @@ def main(listen_socket, communicator):
             elif command == "protocol" and kwargs["subcommand"] == "reveal":
                 encoding = kwargs.get("encoding", None)
                 protocol = protocol_stack[-1]
+                dst = kwargs.get("dst", None)
                 share = operand_stack.pop()
-                secret = protocol.reveal(share, encoding=encoding)
+                secret = protocol.reveal(share, dst=dst, encoding=encoding)
                 operand_stack.append(secret)
                 _send_result(client)
 
@@ -284,6 +291,16 @@ def main(listen_socket, communicator):
                 operand_stack.append(result)
                 _send_result(client)
 
+            # Private-private division with precomputed masks, for testing.
+            elif command == "protocol" and kwargs["subcommand"] == "divide" and "masks" in kwargs:
+                protocol = protocol_stack[-1]
+                masks = {name: operand_stack.pop() for name in reversed(kwargs["masks"])}
+                b = operand_stack.pop()
+                a = operand_stack.pop()
+                share = protocol.divide(a, b, **masks)
+                operand_stack.append(share)
+                _send_result(client)
+
             # Binary protocol suite operations.
             elif command == "protocol" and kwargs["subcommand"] in [
                 "add",
@@ -313,6 +330,16 @@ def main(listen_socket, communicator):
                 operand_stack.append(share)
                 _send_result(client)
 
+            # Minimum and maximum.
+            elif command == "protocol" and kwargs["subcommand"] == "min_max":
+                protocol = protocol_stack[-1]
+                b = operand_stack.pop()
+                a = operand_stack.pop()
+                min_share, max_share = protocol.min_max(a, b)
+                operand_stack.append(min_share)
+                operand_stack.append(max_share)
+                _send_result(client)
+
             # Random bitwise secret.
             elif command == "protocol" and kwargs["subcommand"] == "random_bitwise_secret":
                 protocol = protocol_stack[-1]
@@ -322,6 +349,18 @@ def main(listen_socket, communicator):
                 operand_stack.append(secret)
                 _send_result(client)
 
+            # Least significant bit with optional precomputed masks, for testing.
+            elif command == "protocol" and kwargs["subcommand"] == "_lsb":
+                protocol = protocol_stack[-1]
+                mask = operand_stack.pop()
+                mask_bits = operand_stack.pop()
+                a = operand_stack.pop()
+                mask_bits = mask_bits if kwargs["mask_bits"] else None
+                mask = mask if kwargs["mask"] else None
+                share = protocol._lsb(a, mask_bits=mask_bits, mask=mask)
+                operand_stack.append(share)
+                _send_result(client)
+
             # Uniform random secret generation.
             elif command == "protocol" and kwargs["subcommand"] == "field_uniform":
                 protocol = protocol_stack[-1]
@@ -399,6 +399,8 @@ class Tag(enum.IntEnum):
 
     # Protocol-specific operations.
     PRZS = -30 # Pseudorandom Zero-Sharing.
+    MULTIPLY = -31 # Private-private multiplication.
+    REVEAL = -32 # Non-blocking reveal.
 
 
 def tagname(tag):
@@ -275,13 +275,20 @@ class FixedPoint(object):
         result = numpy.asarray(array, dtype=numpy.float64)
         # Shift array values left.  Don't do this inline!
         result = result * self._scale
-        # Test to be sure our values are in-range for the field.
+        # Test to be sure our values are finite and in-range for the field.
+        # NaN fails every comparison, so it has to be caught explicitly.
+        if not numpy.isfinite(result).all():
+            raise ValueError("Values to be encoded must be finite.") # pragma: no cover
         if numpy.any(numpy.abs(result) >= posbound):
             raise ValueError("Values to be encoded are too large for representation in the field.") # pragma: no cover
-        # Convert to integers, using the Python modulo operator to handle negative values.
-        result = numpy.array([int(x) % order for x in numpy.nditer(result)], dtype=field.dtype).reshape(result.shape)
-        # Convert to a field.
-        return field(result)
+        # Convert to integers, using the Python modulo operator to handle
+        # negative values.  The results are already valid field values, so
+        # there's no need to convert them again.  When every in-range value
+        # fits in an int64 we can truncate them all at once, instead of
+        # converting one element at a time.
+        if posbound <= 2**63:
+            return numpy.array(result.astype(numpy.int64).astype(object) % order, dtype=field.dtype)
+        return numpy.array([int(x) % order for x in result.flat], dtype=field.dtype).reshape(result.shape)
 
 
     @property
@@ -59,16 +59,18 @@ class PRZSProtocol(object):
             request = communicator.isend(value=seed, dst=next_rank, tag=Tag.PRZS)
             result = communicator.irecv(src=prev_rank, tag=Tag.PRZS)
 
-            request.wait()
-            result.wait()
+            # Setup our own random number generator while the seeds are in transit.
+            self._g0 = numpy.random.default_rng(seed=seed)
 
+            result.wait()
             prev_seed = result.value
-        else:
-            prev_seed = seed
+            self._g1 = numpy.random.default_rng(seed=prev_seed)
 
-        # Setup random number generators
-        self._g0 = numpy.random.default_rng(seed=seed)
-        self._g1 = numpy.random.default_rng(seed=prev_seed)
+            request.wait()
+        else:
+            # Setup random number generators
+            self._g0 = numpy.random.default_rng(seed=seed)
+            self._g1 = numpy.random.default_rng(seed=seed)
 
 
     def __call__(self, *, shape):
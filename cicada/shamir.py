@@ -1973,9 +1973,11 @@ class ShamirProtocolSuite(ShamirBasicProtocolSuite):
         if not isinstance(operand, ShamirArrayShare):
             raise ValueError(f"Expected operand to be an instance of ShamirArrayShare, got {type(operand)} instead.") # pragma: no cover
 
-        shift_left = self.field.full_like(operand.storage, 2**bits)
+        # Both shift constants broadcast, so they don't need to match the
+        # operand shape.
+        shift_left = numpy.array(2**bits, dtype=self.field.dtype)
         # Multiplicative inverse of shift_left.
-        shift_right = self.field.full_like(operand.storage, pow(2**bits, self.field.order-2, self.field.order))
+        shift_right = self.field.inverse_power_of_two(bits)
 
         if trunc_mask:
             truncation_mask = trunc_mask
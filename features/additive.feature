@@ -172,6 +172,25 @@ Feature: Additive Protocol
         | 3       | 0.5  | 0.3  | 1.6666        |
 
 
+    @calculator
+    Scenario Outline: Divide Masked
+        Given a calculator service with <players> players
+        And a new Additive protocol suite
+        And player 0 secret shares <a>
+        And player 1 secret shares <b>
+        When the players divide the shares using masks <masks>
+        And the players reveal the secret
+        Then the result should match <result> to within 2 digits
+
+        Examples:
+        | players | a   | b   | masks                                                        | result |
+        | 3       | 1   | 5   | ["rmask"]                                                    | 0.2    |
+        | 3       | 2   | 16  | ["mask1", "rem1"]                                            | 1/8    |
+        | 3       | -37 | 1   | ["mask2", "rem2"]                                            | -37.0  |
+        | 3       | 0.5 | 0.3 | ["mask3", "rem3"]                                            | 1.6666 |
+        | 3       | 2   | -16 | ["rmask", "mask1", "rem1", "mask2", "rem2", "mask3", "rem3"] | -1/8   |
+
+
     @calculator
     Scenario Outline: Divide Private Public
         Given a calculator service with <players> players
@@ -183,15 +202,16 @@ Feature: Additive Protocol
         Then the result should match <result> to within 2 digits
 
         Examples:
-        | players | a    | b    | result        |
-        | 3       | 0    | 5    | 0             |
-        | 3       | 1    | 5    | 0.2           |
-        | 3       | 2    | 16   | 1/8           |
-        | 3       | 37   | 1    | 37.0          |
-        | 3       | -1   | 5    | -0.2          |
-        | 3       | 2    | -16  | -1/8          |
-        | 3       | -37  | 1    | -37.0         |
-        | 3       | 0.5  | 0.3  | 1.6666        |
+        | players | a      | b       | result        |
+        | 3       | 0      | 5       | 0             |
+        | 3       | 1      | 5       | 0.2           |
+        | 3       | 2      | 16      | 1/8           |
+        | 3       | 37     | 1       | 37.0          |
+        | 3       | -1     | 5       | -0.2          |
+        | 3       | 2      | -16     | -1/8          |
+        | 3       | -37    | 1       | -37.0         |
+        | 3       | 0.5    | 0.3     | 1.6666        |
+        | 3       | [1, 2] | [5, 16] | [0.2, 1/8]    |
 
 
     @calculator
@@ -400,6 +420,57 @@ Feature: Additive Protocol
         | 3       | [-1, 2, 3.75, -2.0625] | 2**64-60 | [1,1,1,1]   |
 
 
+    @calculator
+    Scenario Outline: Field Power Elementwise
+        Given a calculator service with <players> players
+        And a new Additive protocol suite
+        And player 0 secret shares the field values <a>
+        And public value <b>
+        When the players raise the share to the public power in the field
+        And the players reveal the field values
+        Then the result should match <result>
+
+        Examples:
+        | players | a          | b          | result          |
+        | 3       | [2, 3, 5]  | 0          | [1, 1, 1]       |
+        | 3       | [2, 3, 5]  | [0, 0, 0]  | [1, 1, 1]       |
+        | 3       | [2, 3, 5]  | [2, 2, 2]  | [4, 9, 25]      |
+        | 3       | [2, 3, 5]  | [0, 1, 3]  | [1, 3, 125]     |
+        | 3       | [0, 7, 2]  | [0, 2, 10] | [1, 49, 1024]   |
+
+
+    @calculator
+    Scenario Outline: Field Power Negative Exponent
+        Given a calculator service with <players> players
+        And a new Additive protocol suite
+        And player 0 secret shares the field values <a>
+        And public value <b>
+        When the players try to raise the share to the public power in the field
+        Then the returned exceptions should be instances of ValueError
+
+        Examples:
+        | players | a          | b           |
+        | 3       | 2          | -1          |
+        | 3       | [2, 3, 5]  | [0, -1, 3]  |
+
+
+    @calculator
+    Scenario Outline: Field Power Result Independence
+        Given a calculator service with <players> players
+        And a new Additive protocol suite
+        And player 0 secret shares the field values <a>
+        And public value <b>
+        When the players raise the share to the public power in the field and zero the result
+        And the players reveal the field values
+        Then the result should match <a>
+
+        Examples:
+        | players | a          | b          |
+        | 3       | [2, 3, 5]  | 1          |
+        | 3       | [2, 3, 5]  | [1, 1, 1]  |
+        | 3       | [2, 3, 5]  | [0, 1, 3]  |
+
+
     @calculator
     Scenario Outline: Field Subtract
         Given a calculator service with <players> players
@@ -491,6 +562,21 @@ Feature: Additive Protocol
         Then the two values should not be equal
 
 
+    @calculator
+    Scenario Outline: Least Significant Bit Mask Pairing
+        Given a calculator service with 3 players
+        And a new Additive protocol suite
+        And player 0 secret shares 5
+        When the players generate 64 random bits
+        And the players extract the least significant bit with mask bits <mask_bits> and mask <mask>
+        Then the returned exceptions should be instances of ValueError
+
+        Examples:
+        | mask_bits | mask  |
+        | True      | False |
+        | False     | True  |
+
+
     @calculator
     Scenario Outline: Less
         Given a calculator service with <players> players
@@ -644,6 +730,26 @@ Feature: Additive Protocol
         | 3       | [2, 3, -2, -1] | [3.5, 1, -2, -4]   | [2, 1, -2, -4]   |
 
 
+    @calculator
+    Scenario Outline: Minimum and Maximum
+        Given a calculator service with <players> players
+        And a new Additive protocol suite
+        And player 0 secret shares <a>
+        And player 1 secret shares <b>
+        When the players compute the minimum and maximum of the shares
+        And the players reveal the secret
+        Then the result should match <max>
+        When the players swap
+        And the players reveal the secret
+        Then the result should match <min>
+
+        Examples:
+        | players | a              | b                  | min              | max              |
+        | 3       | 2              | 3.5                | 2                | 3.5              |
+        | 3       | -4             | -3                 | -4               | -3               |
+        | 4       | [2, 3, -2, -1] | [3.5, 1, -2, -4]   | [2, 1, -2, -4]   | [3.5, 3, -2, -1] |
+
+
     @calculator
     Scenario Outline: Multiplicative Inverse
         Given a calculator service with <players> players
@@ -761,6 +867,12 @@ Feature: Additive Protocol
         | 3       | [-1]                   | 3  | [-1]                                  |
         | 3       | [-1, 2, 3.75, -2.0625] | 3  | [-1, 8, 52.734375, -8.773681640625]   |
 
+        Examples:
+        | players | a                  | b                | result             |
+        | 3       | [-2, -1.5, 2]      | [0, 1, 3]        | [1, -1.5, 8]       |
+        | 3       | [-2, 3]            | [0, 0]           | [1, 1]             |
+        | 3       | [[-1, 2], [3, -4]] | [[2, 0], [1, 3]] | [[1, 1], [3, -64]] |
+
 
     @calculator
     Scenario Outline: Random Bitwise Secret
@@ -820,6 +932,40 @@ Feature: Additive Protocol
         | 3       | 2      | [2.3, 7.9]    | [2.3, 7.9]  |
 
 
+    @calculator
+    Scenario Outline: Reveal Subset
+        Given a calculator service with <players> players
+        And a new Additive protocol suite
+        And player 0 secret shares <value>
+        When the players reveal the secret to <dst>
+        Then players <dst> should receive <value>
+
+        Examples:
+        | players | dst       | value       |
+        | 3       | [0]       | 1.5         |
+        | 3       | [2]       | [2.3, 7.9]  |
+        | 4       | [0, 2]    | -3.5        |
+        | 4       | [3, 1]    | [2.3, 7.9]  |
+        | 5       | [0, 2, 4] | [[1, 2]]    |
+
+
+    @calculator
+    Scenario Outline: Reveal Invalid Destination
+        Given a calculator service with <players> players
+        And a new Additive protocol suite
+        And player 0 secret shares <value>
+        When the players try to reveal the secret to <dst>
+        Then the returned exceptions should be instances of ValueError
+
+        Examples:
+        | players | dst       | value       |
+        | 3       | []        | 1.5         |
+        | 3       | [0, 0]    | 1.5         |
+        | 3       | [1, 2, 1] | [2.3, 7.9]  |
+        | 3       | [3]       | 1.5         |
+        | 3       | [-1]      | 1.5         |
+
+
     @calculator
     Scenario Outline: Round Trip Sharing
         Given a calculator service with <players> players
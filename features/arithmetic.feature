@@ -115,6 +115,20 @@ Feature: Arithmetic
         | default Field  | Field with order 251             | unequal  |
 
 
+    Scenario Outline: Field Inverse Power of Two
+        Given a <field>
+        When generating the inverse of two to the power <bits>
+        And the field array is multiplied by 2**<bits>
+        Then the field array should match 1
+
+        Examples:
+        | field                | bits |
+        | default Field        | 0    |
+        | default Field        | 16   |
+        | default Field        | 63   |
+        | Field with order 251 | 7    |
+
+
     Scenario Outline: Field Primality
         When a field with order <order> is created, it <outcome>
 
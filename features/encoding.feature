@@ -87,3 +87,16 @@ Feature: Encodings
         | Boolean encoding                   | default Field         | [1]                   |
         | Boolean encoding                   | default Field         | [0, 1]                |
 
+
+    Scenario Outline: Invalid FixedPoint Encoding
+        Given a default FixedPoint encoding
+        And a default Field
+        When <x> is encoded, it should raise an exception
+
+        Examples:
+        | x                          |
+        | numpy.nan                  |
+        | [1.5, numpy.nan]           |
+        | numpy.inf                  |
+        | -numpy.inf                 |
+        | 2**62                      |
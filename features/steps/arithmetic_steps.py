@@ -89,6 +89,23 @@ def step_impl(context, other):
     context.fieldarrays.append(field.zeros_like(other))
 
 
+@when(u'generating the inverse of two to the power {bits}')
+def step_impl(context, bits):
+    bits = eval(bits)
+    field = context.fields[-1]
+    if "fieldarrays" not in context:
+        context.fieldarrays = []
+    context.fieldarrays.append(field.inverse_power_of_two(bits))
+
+
+@when(u'the field array is multiplied by {value}')
+def step_impl(context, value):
+    field = context.fields[-1]
+    value = field(eval(value))
+    fieldarray = context.fieldarrays.pop()
+    context.fieldarrays.append(field.multiply(fieldarray, value))
+
+
 @when(u'the field array is negated')
 def step_impl(context):
     field = context.fields[-1]
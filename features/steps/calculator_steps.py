@@ -22,6 +22,7 @@ import numpy
 
 from cicada.calculator import Client, PlayerError, main
 from cicada.communicator import SocketCommunicator
+import cicada.arithmetic
 import cicada.encoding
 
 import test
@@ -96,6 +97,16 @@ def step_impl(context, player, secret):
     _require_success(context.calculator.command("protocol", subcommand="share", src=player, shape=secret.shape, encoding=cicada.encoding.Identity()))
 
 
+@given(u'player {player} secret shares the field values {secret}')
+def step_impl(context, player, secret):
+    player = eval(player)
+    secret = numpy.array(eval(secret), dtype=object)
+
+    for rank in context.calculator.ranks:
+        _require_success(context.calculator.command("oppush", value=secret if player == rank else None, player=rank))
+    _require_success(context.calculator.command("protocol", subcommand="share", src=player, shape=secret.shape, encoding=cicada.encoding.Identity()))
+
+
 @given(u'player {player} secret shares {secret}')
 def step_impl(context, player, secret):
     player = eval(player)
@@ -194,6 +205,11 @@ def step_impl(context):
     _require_success(context.calculator.command("protocol", subcommand="maximum"))
 
 
+@when(u'the players compute the minimum and maximum of the shares')
+def step_impl(context):
+    _require_success(context.calculator.command("protocol", subcommand="min_max"))
+
+
 @when(u'the players compute the minimum of the shares')
 def step_impl(context):
     _require_success(context.calculator.command("protocol", subcommand="minimum"))
@@ -220,6 +236,20 @@ def step_impl(context):
     _require_success(context.calculator.command("protocol", subcommand="zigmoid"))
 
 
+@when(u'the players divide the shares using masks {names}')
+def step_impl(context, names):
+    names = eval(names)
+    precision = cicada.encoding.FixedPoint().precision
+    for name in names:
+        # Remainder masks cover the field bits left over after truncation.
+        bits = cicada.arithmetic.Field().bits - precision if name.startswith("rem") else precision
+        _require_success(context.calculator.command("oppush", value=bits))
+        _require_success(context.calculator.command("protocol", subcommand="random_bitwise_secret"))
+        _require_success(context.calculator.command("opswap"))
+        _require_success(context.calculator.command("oppop"))
+    _require_success(context.calculator.command("protocol", subcommand="divide", masks=names))
+
+
 @when(u'the players divide the shares')
 def step_impl(context):
     _require_success(context.calculator.command("protocol", subcommand="divide"))
@@ -230,6 +260,14 @@ def step_impl(context):
     _require_success(context.calculator.command("share", subcommand="getstorage"))
 
 
+@when(u'the players extract the least significant bit with mask bits {mask_bits} and mask {mask}')
+def step_impl(context, mask_bits, mask):
+    mask_bits = eval(mask_bits)
+    mask = eval(mask)
+    players, results = context.calculator.command("protocol", subcommand="_lsb", mask_bits=mask_bits, mask=mask)
+    context.errors = results
+
+
 @when(u'the players generate {bits} random bits')
 def step_impl(context, bits):
     bits = eval(bits)
@@ -263,12 +301,42 @@ def step_impl(context):
     _require_success(context.calculator.command("protocol", subcommand="field_power"))
 
 
+@when(u'the players try to raise the share to the public power in the field')
+def step_impl(context):
+    players, results = context.calculator.command("protocol", subcommand="field_power")
+    context.errors = results
+
+
+@when(u'the players raise the share to the public power in the field and zero the result')
+def step_impl(context):
+    # Keep a copy of the original share below the result.
+    rhs = _require_success(context.calculator.command("oppop"))[0]
+    _require_success(context.calculator.command("opdup"))
+    _require_success(context.calculator.command("oppush", value=rhs))
+    _require_success(context.calculator.command("protocol", subcommand="field_power"))
+    _require_success(context.calculator.command("share", subcommand="zerostorage"))
+    _require_success(context.calculator.command("oppop"))
+
+
 @when(u'the players reveal the secret')
 def step_impl(context):
     _require_success(context.calculator.command("protocol", subcommand="_verify_storage"))
     _require_success(context.calculator.command("protocol", subcommand="reveal"))
 
 
+@when(u'the players reveal the secret to {dst}')
+def step_impl(context, dst):
+    dst = eval(dst)
+    _require_success(context.calculator.command("protocol", subcommand="reveal", dst=dst))
+
+
+@when(u'the players try to reveal the secret to {dst}')
+def step_impl(context, dst):
+    dst = eval(dst)
+    players, results = context.calculator.command("protocol", subcommand="reveal", dst=dst)
+    context.errors = results
+
+
 @when(u'the players reveal the secret bits')
 def step_impl(context):
     _require_success(context.calculator.command("protocol", subcommand="reveal", encoding=cicada.encoding.Identity()))
@@ -340,6 +408,18 @@ def step_impl(context, rhs):
         numpy.testing.assert_array_equal(lhs, rhs)
 
 
+@then(u'players {dst} should receive {rhs}')
+def step_impl(context, dst, rhs):
+    dst = eval(dst)
+    rhs = eval(rhs)
+
+    for rank, lhs in zip(context.calculator.ranks, _require_success(context.calculator.command("opget"))):
+        if rank in dst:
+            numpy.testing.assert_array_almost_equal(lhs, rhs, decimal=4)
+        else:
+            test.assert_is_none(lhs)
+
+
 @then(u'the two values should not be equal')
 def step_impl(context):
     values = _require_success(context.calculator.command("opgetn", n=2))
@@ -371,6 +451,15 @@ def step_impl(context, exception):
         test.assert_equal(error.exception.args, exception.args)
 
 
+@then(u'the returned exceptions should be instances of {exception}')
+def step_impl(context, exception):
+    exception = eval(exception)
+    test.assert_equal(len(context.errors), len(context.calculator.ranks))
+    for error in context.errors:
+        test.assert_is_instance(error, PlayerError)
+        test.assert_is_instance(error.exception, exception)
+
+
 @then(u'the results should match shape {shape}')
 def step_impl(context, shape):
     shape = eval(shape)
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import unittest
 import test
 
 from behave import *
@@ -72,6 +73,18 @@ def step_impl(context, value):
     context.decoded = decoded
 
 
+@when(u'{value} is encoded, it should raise an exception')
+def step_impl(context, value):
+    value = numpy.array(eval(value))
+
+    encoding = context.encodings[-1]
+    field = context.fields[-1]
+
+    with unittest.TestCase().assertRaises(ValueError) as cm:
+        encoding.encode(value, field)
+    print(cm.exception)
+
+
 @then(u'the encodings should compare equal')
 def step_impl(context):
     lhs, rhs = context.encodings